@@ -0,0 +1,18 @@
+-- Trigram GIN indexes so find_persons_simple's leading-wildcard ILIKE
+-- searches stop seq-scanning persons. The ILIKE SQL itself is unchanged;
+-- the planner picks these up automatically.
+--
+-- Run with psql against a live database. CREATE INDEX CONCURRENTLY
+-- cannot run inside a transaction block, so apply this file with:
+--   psql -U genealogy -d genealogy -f migrations/001_pg_trgm_indexes.sql
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS persons_surname_trgm
+    ON persons USING gin (surname gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS persons_given_name_trgm
+    ON persons USING gin (given_name gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS persons_full_name_normalized_trgm
+    ON persons USING gin (full_name_normalized gin_trgm_ops);
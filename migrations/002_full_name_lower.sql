@@ -0,0 +1,14 @@
+-- Stored generated column with the lowercase "given surname" string, plus
+-- a text_pattern_ops B-tree so exact and prefix name lookups skip the
+-- trigram index entirely.
+--
+-- Apply with:
+--   psql -U genealogy -d genealogy -f migrations/002_full_name_lower.sql
+
+ALTER TABLE persons
+    ADD COLUMN IF NOT EXISTS full_name_lower TEXT GENERATED ALWAYS AS (
+        lower(coalesce(given_name, '') || ' ' || coalesce(surname, ''))
+    ) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS persons_full_name_lower
+    ON persons (full_name_lower text_pattern_ops);
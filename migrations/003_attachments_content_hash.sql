@@ -0,0 +1,8 @@
+-- SHA-256 of the downloaded file, computed while streaming it to disk
+-- in fetch_attachments_for_person.
+--
+-- Apply with:
+--   psql -U genealogy -d genealogy -f migrations/003_attachments_content_hash.sql
+
+ALTER TABLE attachments
+    ADD COLUMN IF NOT EXISTS content_hash TEXT;
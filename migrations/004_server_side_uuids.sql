@@ -0,0 +1,16 @@
+-- Generate primary keys in Postgres with gen_random_uuid() (built in
+-- since PostgreSQL 13; no pgcrypto needed on the bundled PostgreSQL 16)
+-- so the server no longer marshals client-side UUID strings and inserts
+-- get their ids back via RETURNING.
+--
+-- Apply with:
+--   psql -U genealogy -d genealogy -f migrations/004_server_side_uuids.sql
+
+ALTER TABLE persons ALTER COLUMN person_id SET DEFAULT gen_random_uuid();
+ALTER TABLE sources ALTER COLUMN source_id SET DEFAULT gen_random_uuid();
+ALTER TABLE events ALTER COLUMN event_id SET DEFAULT gen_random_uuid();
+ALTER TABLE professions ALTER COLUMN profession_id SET DEFAULT gen_random_uuid();
+ALTER TABLE addresses ALTER COLUMN address_id SET DEFAULT gen_random_uuid();
+ALTER TABLE comments ALTER COLUMN comment_id SET DEFAULT gen_random_uuid();
+ALTER TABLE attachments ALTER COLUMN attachment_id SET DEFAULT gen_random_uuid();
+ALTER TABLE relationships ALTER COLUMN relationship_id SET DEFAULT gen_random_uuid();
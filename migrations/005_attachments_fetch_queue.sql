@@ -0,0 +1,13 @@
+-- Partial index matching fetch_attachments_for_person's queue selector
+-- (person_id + should_fetch AND NOT fetched AND download_url IS NOT NULL),
+-- replacing the broad (should_fetch, fetched) index which could not
+-- narrow by person and indexed every row.
+--
+-- Apply with:
+--   psql -U genealogy -d genealogy -f migrations/005_attachments_fetch_queue.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS attachments_fetch_queue
+    ON attachments (person_id)
+    WHERE should_fetch AND NOT fetched AND download_url IS NOT NULL;
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_attachments_fetch;
@@ -0,0 +1,25 @@
+-- Compound indexes matching the list_person_* ORDER BY clauses, so each
+-- listing is an index scan with no sort node. ASC B-tree indexes store
+-- nulls last, which is exactly the NULLS LAST ordering the queries ask
+-- for. The old single-column person_id indexes become redundant prefixes
+-- and are dropped.
+--
+-- Apply with:
+--   psql -U genealogy -d genealogy -f migrations/006_list_order_indexes.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS events_person_date
+    ON events(person_id, year, month, day);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS professions_person_start
+    ON professions(person_id, start_year);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS addresses_person_start
+    ON addresses(person_id, start_year);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS comments_person_created
+    ON comments(person_id, created_at);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_events_person;
+DROP INDEX CONCURRENTLY IF EXISTS idx_professions_person;
+DROP INDEX CONCURRENTLY IF EXISTS idx_addresses_person;
+DROP INDEX CONCURRENTLY IF EXISTS idx_comments_person;
@@ -0,0 +1,12 @@
+-- Partial index over the pending crawl queue in dequeue (first_seen)
+-- order, backing get_unprocessed_crawls' SKIP LOCKED claim. Replaces
+-- the whole-table boolean index, which indexed mostly-processed rows.
+--
+-- Apply with:
+--   psql -U genealogy -d genealogy -f migrations/007_crawl_log_unprocessed.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS crawl_log_unprocessed
+    ON crawl_log(first_seen)
+    WHERE NOT processed;
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_crawl_log_processed;
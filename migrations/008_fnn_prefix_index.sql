@@ -0,0 +1,18 @@
+-- Prefix B-tree on full_name_normalized, which the server now writes in
+-- fully folded form (NFKD, diacritics stripped to ASCII, casefolded) at
+-- insert time, so prefix searches skip the trigram index.
+--
+-- Apply with:
+--   psql -U genealogy -d genealogy -f migrations/008_fnn_prefix_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS persons_fnn_prefix
+    ON persons (full_name_normalized text_pattern_ops);
+
+-- Optional backfill for rows inserted before the server folded names
+-- itself. unaccent() approximates the Python-side NFKD/ASCII fold.
+-- CREATE EXTENSION IF NOT EXISTS unaccent;
+-- UPDATE persons
+-- SET full_name_normalized =
+--         lower(unaccent(coalesce(given_name, '') || ' ' || coalesce(surname, '')))
+-- WHERE full_name_normalized IS NULL
+--   AND (given_name IS NOT NULL OR surname IS NOT NULL);
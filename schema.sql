@@ -2,6 +2,9 @@
 -- Genealogy Memory Database Schema (final unified version)
 -- ============================================================
 
+-- Trigram matching for ILIKE '%...%' name searches.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- Drop tables in dependency-safe order if you are recreating
 -- (ONLY if you are ok losing existing data).
 -- DROP TABLE IF EXISTS relationships;
@@ -19,7 +22,7 @@
 ------------------------------------------------------------
 
 CREATE TABLE persons (
-    person_id UUID PRIMARY KEY,
+    person_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     given_name TEXT,
     prefix TEXT,
     surname TEXT,
@@ -36,12 +39,36 @@ CREATE TABLE persons (
     verified BOOLEAN DEFAULT FALSE,
     research_status TEXT DEFAULT 'unreviewed',
     research_notes TEXT,
-    possible_duplicate_of UUID REFERENCES persons(person_id)
+    possible_duplicate_of UUID REFERENCES persons(person_id),
+
+    -- lowercase "given surname" kept by Postgres for cheap exact/prefix lookups
+    full_name_lower TEXT GENERATED ALWAYS AS (
+        lower(coalesce(given_name, '') || ' ' || coalesce(surname, ''))
+    ) STORED
 );
 
 CREATE INDEX idx_persons_name
     ON persons (surname, given_name);
 
+-- Trigram indexes backing find_persons_simple's substring ILIKE search.
+CREATE INDEX persons_surname_trgm
+    ON persons USING gin (surname gin_trgm_ops);
+
+CREATE INDEX persons_given_name_trgm
+    ON persons USING gin (given_name gin_trgm_ops);
+
+CREATE INDEX persons_full_name_normalized_trgm
+    ON persons USING gin (full_name_normalized gin_trgm_ops);
+
+-- B-tree for exact/prefix hits on the generated lowercase full name.
+CREATE INDEX persons_full_name_lower
+    ON persons (full_name_lower text_pattern_ops);
+
+-- Prefix B-tree on the folded (NFKD/ASCII/casefold) name written at
+-- insert time.
+CREATE INDEX persons_fnn_prefix
+    ON persons (full_name_normalized text_pattern_ops);
+
 ------------------------------------------------------------
 -- CRAWL LOG
 ------------------------------------------------------------
@@ -57,15 +84,17 @@ CREATE TABLE crawl_log (
     notes TEXT
 );
 
-CREATE INDEX idx_crawl_log_processed
-    ON crawl_log(processed);
+-- Partial index over the pending queue only, in dequeue order.
+CREATE INDEX crawl_log_unprocessed
+    ON crawl_log(first_seen)
+    WHERE NOT processed;
 
 ------------------------------------------------------------
 -- SOURCES
 ------------------------------------------------------------
 
 CREATE TABLE sources (
-    source_id UUID PRIMARY KEY,
+    source_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     source_type TEXT,
     archive_code TEXT,
     archive_name TEXT,
@@ -92,7 +121,7 @@ CREATE INDEX idx_sources_url
 ------------------------------------------------------------
 
 CREATE TABLE events (
-    event_id UUID PRIMARY KEY,
+    event_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     person_id UUID NOT NULL
         REFERENCES persons(person_id) ON DELETE CASCADE,
     event_type TEXT NOT NULL,
@@ -107,15 +136,17 @@ CREATE TABLE events (
     notes TEXT
 );
 
-CREATE INDEX idx_events_person
-    ON events(person_id);
+-- Matches list_person_events' ORDER BY so the planner returns rows in
+-- index order instead of sorting per call.
+CREATE INDEX events_person_date
+    ON events(person_id, year, month, day);
 
 ------------------------------------------------------------
 -- PROFESSIONS
 ------------------------------------------------------------
 
 CREATE TABLE professions (
-    profession_id UUID PRIMARY KEY,
+    profession_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     person_id UUID NOT NULL
         REFERENCES persons(person_id) ON DELETE CASCADE,
     title TEXT NOT NULL,
@@ -127,15 +158,15 @@ CREATE TABLE professions (
     notes TEXT
 );
 
-CREATE INDEX idx_professions_person
-    ON professions(person_id);
+CREATE INDEX professions_person_start
+    ON professions(person_id, start_year);
 
 ------------------------------------------------------------
 -- ADDRESSES
 ------------------------------------------------------------
 
 CREATE TABLE addresses (
-    address_id UUID PRIMARY KEY,
+    address_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     person_id UUID NOT NULL
         REFERENCES persons(person_id) ON DELETE CASCADE,
     street TEXT,
@@ -150,15 +181,15 @@ CREATE TABLE addresses (
     notes TEXT
 );
 
-CREATE INDEX idx_addresses_person
-    ON addresses(person_id);
+CREATE INDEX addresses_person_start
+    ON addresses(person_id, start_year);
 
 ------------------------------------------------------------
 -- COMMENTS
 ------------------------------------------------------------
 
 CREATE TABLE comments (
-    comment_id UUID PRIMARY KEY,
+    comment_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     person_id UUID
         REFERENCES persons(person_id) ON DELETE SET NULL,
     source_id UUID
@@ -168,15 +199,15 @@ CREATE TABLE comments (
     created_at TIMESTAMP DEFAULT NOW()
 );
 
-CREATE INDEX idx_comments_person
-    ON comments(person_id);
+CREATE INDEX comments_person_created
+    ON comments(person_id, created_at);
 
 ------------------------------------------------------------
 -- ATTACHMENTS
 ------------------------------------------------------------
 
 CREATE TABLE attachments (
-    attachment_id UUID PRIMARY KEY,
+    attachment_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     source_id UUID
         REFERENCES sources(source_id) ON DELETE SET NULL,
     person_id UUID
@@ -190,21 +221,25 @@ CREATE TABLE attachments (
     -- deferred download
     download_url TEXT,
     should_fetch BOOLEAN DEFAULT FALSE,
-    fetched BOOLEAN DEFAULT FALSE
+    fetched BOOLEAN DEFAULT FALSE,
+    content_hash TEXT
 );
 
 CREATE INDEX idx_attachments_person
     ON attachments(person_id);
 
-CREATE INDEX idx_attachments_fetch
-    ON attachments(should_fetch, fetched);
+-- Partial index covering exactly the rows fetch_attachments_for_person
+-- selects, so the queue lookup stays O(pending) as attachments grow.
+CREATE INDEX attachments_fetch_queue
+    ON attachments (person_id)
+    WHERE should_fetch AND NOT fetched AND download_url IS NOT NULL;
 
 ------------------------------------------------------------
 -- RELATIONSHIPS
 ------------------------------------------------------------
 
 CREATE TABLE relationships (
-    relationship_id UUID PRIMARY KEY,
+    relationship_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     person_id_a UUID NOT NULL
         REFERENCES persons(person_id) ON DELETE CASCADE,
     person_id_b UUID NOT NULL
@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
+import hashlib
 import os
+import threading
+import unicodedata
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
-import psycopg2
-from psycopg2.extras import RealDictCursor
+import psycopg
+from cachetools import TTLCache
+from psycopg.rows import dict_row
+from psycopg_pool import ConnectionPool
 
 from mcp.server.fastmcp import FastMCP
 
@@ -17,6 +23,22 @@ from pathlib import Path
 
 mcp = FastMCP("genealogy_memory")
 
+# Attachment downloads land here (bind-mount to a host directory).
+# Created once at import so the fetch tool skips a mkdir syscall per call.
+ATTACHMENTS_DIR = Path("/attachments")
+ATTACHMENTS_DIR.mkdir(exist_ok=True)
+ATTACHMENTS_DIR_STR = str(ATTACHMENTS_DIR)
+
+# Shared keep-alive HTTP session so downloads reuse TCP/TLS connections
+# across tool calls instead of re-handshaking per URL. Pool size matches
+# the download thread pool.
+HTTP = requests.Session()
+for _scheme in ("http://", "https://"):
+    HTTP.mount(
+        _scheme,
+        requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32),
+    )
+
 # DB configuration via environment, with sensible defaults
 DB = {
     "host": os.getenv("DB_HOST", "db"),
@@ -27,8 +49,29 @@ DB = {
 }
 
 
+def _configure_connection(conn: psycopg.Connection) -> None:
+    conn.row_factory = dict_row
+    # Let psycopg promote every repeated statement to a server-side
+    # prepared statement from its first re-execution onwards.
+    conn.prepare_threshold = 1
+
+
+# Reuse backend connections across tool calls instead of paying a fresh
+# TCP + auth handshake per statement.
+POOL = ConnectionPool(
+    kwargs=DB,
+    min_size=4,
+    max_size=32,
+    configure=_configure_connection,
+)
+
+
 def db_conn():
-    return psycopg2.connect(**DB, cursor_factory=RealDictCursor)
+    """
+    Check a connection out of the pool. The context manager commits on
+    success, rolls back on error and returns the connection to the pool.
+    """
+    return POOL.connection()
 
 
 def ok(data: Any) -> Dict[str, Any]:
@@ -39,53 +82,225 @@ def err(code: str, details: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     return {"status": "error", "error": code, "details": details or {}}
 
 
+def _returned_ids(cur, column: str) -> List[str]:
+    """Collect RETURNING values after an executemany(returning=True)."""
+    ids: List[str] = []
+    while True:
+        ids.append(str(cur.fetchone()[column]))
+        if not cur.nextset():
+            break
+    return ids
+
+
+# Explicit column lists for the read tools, so Postgres never has to
+# detoast and ship long-text columns (persons.notes, research_notes)
+# the tool contract does not need. get_person_full exposes the rest.
+PERSON_COLUMNS = (
+    "person_id, given_name, prefix, surname, gender, "
+    "birth_year_estimate, death_year_estimate, full_name_normalized, "
+    "confidence_score, created_at, updated_at, verified, "
+    "research_status, possible_duplicate_of"
+)
+EVENT_COLUMNS = (
+    "event_id, person_id, event_type, date_literal, "
+    "year, month, day, place, country, source_id, notes"
+)
+PROFESSION_COLUMNS = (
+    "profession_id, person_id, title, start_year, "
+    "end_year, location, source_id, notes"
+)
+ADDRESS_COLUMNS = (
+    "address_id, person_id, street, house_number, "
+    "city, province, country, start_year, end_year, source_id, notes"
+)
+COMMENT_COLUMNS = "comment_id, person_id, source_id, author, text, created_at"
+RELATIONSHIP_COLUMNS = (
+    "relationship_id, person_id_a, person_id_b, "
+    "relation_type, confidence_score, notes, created_at"
+)
+CRAWL_COLUMNS = (
+    "crawl_id, url, http_status, content_hash, "
+    "first_seen, last_seen, processed, notes"
+)
+
+# Agents tend to re-list the same person's events/professions/addresses/
+# comments several times in one reasoning turn; serve repeats from a
+# short-lived in-process cache and drop entries whenever we write.
+LIST_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=30)
+LIST_CACHE_LOCK = threading.Lock()
+
+
+def _cache_get(kind: str, person_id: str) -> Optional[Dict[str, Any]]:
+    with LIST_CACHE_LOCK:
+        return LIST_CACHE.get((kind, person_id))
+
+
+def _cache_put(kind: str, person_id: str, value: Dict[str, Any]) -> None:
+    with LIST_CACHE_LOCK:
+        LIST_CACHE[(kind, person_id)] = value
+
+
+def _cache_invalidate(kind: str, person_id: str) -> None:
+    with LIST_CACHE_LOCK:
+        LIST_CACHE.pop((kind, person_id), None)
+
+
 # ----------------------------------------------------------
 # PERSON TOOLS
 # ----------------------------------------------------------
 
+def _fold_name(*parts: Optional[str]) -> Optional[str]:
+    """
+    Fully fold a name for search: NFKD-decompose, strip diacritics down
+    to ASCII, casefold. Doing this once at insert time lets searches use
+    plain LIKE prefixes instead of re-normalizing per query.
+    """
+    joined = " ".join(p for p in parts if p).strip()
+    if not joined:
+        return None
+    folded = (
+        unicodedata.normalize("NFKD", joined)
+        .encode("ascii", "ignore")
+        .decode()
+        .casefold()
+    )
+    return folded or None
+
+
+def _insert_persons(rows: List[Dict[str, Any]]) -> List[str]:
+    """Insert person rows in one round-trip; returns the new person_ids."""
+    tuples = []
+    for row in rows:
+        tuples.append(
+            (
+                row.get("given_name"),
+                row.get("prefix"),
+                row.get("surname"),
+                row.get("gender"),
+                row.get("birth_year_estimate"),
+                row.get("death_year_estimate"),
+                row.get("notes"),
+                row.get("full_name_normalized")
+                or _fold_name(row.get("given_name"), row.get("surname")),
+                row.get("confidence_score", 1.0),
+            )
+        )
+    with db_conn() as conn, conn.cursor() as cur:
+        # executemany coalesces all rows on the wire via pipeline mode.
+        cur.executemany(
+            """
+            INSERT INTO persons (
+                given_name, prefix, surname, gender,
+                birth_year_estimate, death_year_estimate, notes,
+                full_name_normalized, confidence_score
+            ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s)
+            RETURNING person_id
+            """,
+            tuples,
+            returning=True,
+        )
+        return _returned_ids(cur, "person_id")
+
+
 @mcp.tool()
 def add_person(
-    given_name: str = "",
-    prefix: str = "",
-    surname: str = "",
-    gender: str = "",
-    birth_year_estimate: int = 0,
-    death_year_estimate: int = 0,
-    notes: str = "",
-    full_name_normalized: str = "",
+    given_name: Optional[str] = None,
+    prefix: Optional[str] = None,
+    surname: Optional[str] = None,
+    gender: Optional[str] = None,
+    birth_year_estimate: Optional[int] = None,
+    death_year_estimate: Optional[int] = None,
+    notes: Optional[str] = None,
+    full_name_normalized: Optional[str] = None,
     confidence_score: float = 1.0,
 ) -> Dict[str, Any]:
     """
     Create a new person. All fields optional except surname OR given_name.
+    When full_name_normalized is not supplied it is derived from the name
+    (NFKD-decomposed, diacritics stripped, casefolded).
     """
     if not given_name and not surname:
         return err("missing_name", {"message": "At least given_name or surname is required"})
 
-    pid = str(uuid.uuid4())
+    ids = _insert_persons(
+        [
+            {
+                "given_name": given_name,
+                "prefix": prefix,
+                "surname": surname,
+                "gender": gender,
+                "birth_year_estimate": birth_year_estimate,
+                "death_year_estimate": death_year_estimate,
+                "notes": notes,
+                "full_name_normalized": full_name_normalized,
+                "confidence_score": confidence_score,
+            }
+        ]
+    )
+    return ok({"person_id": ids[0]})
+
+
+@mcp.tool()
+def add_persons_bulk(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Insert many persons in a single round-trip.
+    Each row takes the same fields as add_person.
+    """
+    if not rows:
+        return err("missing_rows")
+    for i, row in enumerate(rows):
+        if not row.get("given_name") and not row.get("surname"):
+            return err("missing_name", {"row": i, "message": "At least given_name or surname is required"})
+
+    ids = _insert_persons(rows)
+    return ok({"count": len(ids), "person_ids": ids})
+
+
+@mcp.tool()
+def bulk_copy_persons(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Load many persons via COPY, the fastest PostgreSQL ingest path.
+    Meant for importing existing dumps (e.g. parsed GEDCOM files);
+    for day-to-day inserts use add_person / add_persons_bulk.
+    """
+    if not rows:
+        return err("missing_rows")
+    for i, row in enumerate(rows):
+        if not row.get("given_name") and not row.get("surname"):
+            return err("missing_name", {"row": i, "message": "At least given_name or surname is required"})
+
+    # COPY has no RETURNING, so ids are generated client-side and rows
+    # are streamed straight onto the wire without building a big buffer.
+    ids: List[str] = []
     with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
+        with cur.copy(
             """
-            INSERT INTO persons (
+            COPY persons (
                 person_id, given_name, prefix, surname, gender,
                 birth_year_estimate, death_year_estimate, notes,
                 full_name_normalized, confidence_score
-            )
-            VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-            """,
-            (
-                pid,
-                given_name or None,
-                prefix or None,
-                surname or None,
-                gender or None,
-                birth_year_estimate or None,
-                death_year_estimate or None,
-                notes or None,
-                full_name_normalized or None,
-                confidence_score,
-            ),
-        )
-    return ok({"person_id": pid})
+            ) FROM STDIN
+            """
+        ) as copy:
+            for row in rows:
+                pid = str(uuid.uuid4())
+                ids.append(pid)
+                copy.write_row(
+                    (
+                        pid,
+                        row.get("given_name"),
+                        row.get("prefix"),
+                        row.get("surname"),
+                        row.get("gender"),
+                        row.get("birth_year_estimate"),
+                        row.get("death_year_estimate"),
+                        row.get("notes"),
+                        row.get("full_name_normalized")
+                        or _fold_name(row.get("given_name"), row.get("surname")),
+                        row.get("confidence_score", 1.0),
+                    )
+                )
+    return ok({"count": len(ids), "person_ids": ids})
 
 
 @mcp.tool()
@@ -94,7 +309,31 @@ def get_person(person_id: str) -> Dict[str, Any]:
     Retrieve a person by ID, including basic details only.
     """
     with db_conn() as conn, conn.cursor() as cur:
-        cur.execute("SELECT * FROM persons WHERE person_id = %s", (person_id,))
+        cur.execute(
+            f"SELECT {PERSON_COLUMNS} FROM persons WHERE person_id = %s",
+            (person_id,),
+        )
+        row = cur.fetchone()
+        if not row:
+            return err("not_found", {"person_id": person_id})
+        return ok(row)
+
+
+@mcp.tool()
+def get_person_full(person_id: str) -> Dict[str, Any]:
+    """
+    Retrieve a person by ID including the long-text notes and
+    research_notes columns.
+    """
+    with db_conn() as conn, conn.cursor() as cur:
+        cur.execute(
+            f"""
+            SELECT {PERSON_COLUMNS}, notes, research_notes
+            FROM persons
+            WHERE person_id = %s
+            """,
+            (person_id,),
+        )
         row = cur.fetchone()
         if not row:
             return err("not_found", {"person_id": person_id})
@@ -110,15 +349,36 @@ def find_persons_simple(
     Simple search on surname and given_name using ILIKE.
     Agents should pass partial or full name.
     """
-    if not name_query.strip():
+    query = name_query.strip()
+    if not query:
         return err("missing_query", {"message": "name_query is required"})
     limit = max(1, min(limit, 100))
 
-    like = f"%{name_query}%"
     with db_conn() as conn, conn.cursor() as cur:
+        # Fast path: exact or prefix hit on the generated lowercase full
+        # name or the folded full_name_normalized, served by plain
+        # B-trees instead of the trigram GIN index.
+        if len(query) > 3:
+            cur.execute(
+                f"""
+                SELECT {PERSON_COLUMNS}
+                FROM persons
+                WHERE full_name_lower = lower(%s)
+                   OR full_name_lower LIKE lower(%s) || '%%'
+                   OR full_name_normalized LIKE %s || '%%'
+                ORDER BY surname NULLS LAST, given_name NULLS LAST
+                LIMIT %s
+                """,
+                (query, query, _fold_name(query), limit),
+            )
+            rows = cur.fetchall()
+            if rows:
+                return ok({"count": len(rows), "persons": rows})
+
+        like = f"%{query}%"
         cur.execute(
-            """
-            SELECT *
+            f"""
+            SELECT {PERSON_COLUMNS}
             FROM persons
             WHERE (surname ILIKE %s OR given_name ILIKE %s OR full_name_normalized ILIKE %s)
             ORDER BY surname NULLS LAST, given_name NULLS LAST
@@ -136,65 +396,58 @@ def find_persons_simple(
 
 @mcp.tool()
 def add_source(
-    source_type: str = "",
-    archive_code: str = "",
-    archive_name: str = "",
-    identifier: str = "",
-    url: str = "",
-    collection: str = "",
-    document_number: str = "",
-    registry_number: str = "",
-    institution_name: str = "",
-    raw_json: str = "",
-    notes: str = "",
-    image_url: str = "",
-    crawl_url: str = "",
+    source_type: Optional[str] = None,
+    archive_code: Optional[str] = None,
+    archive_name: Optional[str] = None,
+    identifier: Optional[str] = None,
+    url: Optional[str] = None,
+    collection: Optional[str] = None,
+    document_number: Optional[str] = None,
+    registry_number: Optional[str] = None,
+    institution_name: Optional[str] = None,
+    raw_json: Optional[str] = None,
+    notes: Optional[str] = None,
+    image_url: Optional[str] = None,
+    crawl_url: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Add a source definition (archive/API/local document).
     raw_json should be a JSON string if provided.
     Optionally link to crawl_log via crawl_url (if exists).
     """
-    sid = str(uuid.uuid4())
-    raw_json_text = raw_json or None
-
     with db_conn() as conn, conn.cursor() as cur:
-        crawl_id = None
-        if crawl_url:
-            cur.execute(
-                "SELECT crawl_id FROM crawl_log WHERE url = %s",
-                (crawl_url,),
-            )
-            row = cur.fetchone()
-            if row:
-                crawl_id = row["crawl_id"]
-
+        # Resolve the crawl_id in the INSERT itself rather than with a
+        # separate lookup query; a NULL crawl_url short-circuits the
+        # subquery.
         cur.execute(
             """
             INSERT INTO sources (
-                source_id, source_type, archive_code, archive_name,
+                source_type, archive_code, archive_name,
                 identifier, url, collection, document_number,
                 registry_number, institution_name, raw_json, notes,
                 image_url, crawl_id
-            ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+            )
+            SELECT %s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,
+                   (SELECT crawl_id FROM crawl_log WHERE url = %s)
+            RETURNING source_id
             """,
             (
-                sid,
-                source_type or None,
-                archive_code or None,
-                archive_name or None,
-                identifier or None,
-                url or None,
-                collection or None,
-                document_number or None,
-                registry_number or None,
-                institution_name or None,
-                raw_json_text,
-                notes or None,
-                image_url or None,
-                crawl_id,
+                source_type,
+                archive_code,
+                archive_name,
+                identifier,
+                url,
+                collection,
+                document_number,
+                registry_number,
+                institution_name,
+                raw_json,
+                notes,
+                image_url,
+                crawl_url,
             ),
         )
+        sid = str(cur.fetchone()["source_id"])
     return ok({"source_id": sid})
 
 
@@ -202,18 +455,54 @@ def add_source(
 # EVENT TOOLS
 # ----------------------------------------------------------
 
+def _insert_events(rows: List[Dict[str, Any]]) -> List[str]:
+    """Insert event rows in one round-trip; returns the new event_ids."""
+    tuples = []
+    for row in rows:
+        tuples.append(
+            (
+                row["person_id"],
+                row["event_type"],
+                row.get("date_literal"),
+                row.get("year"),
+                row.get("month"),
+                row.get("day"),
+                row.get("place"),
+                row.get("country"),
+                row.get("source_id"),
+                row.get("notes"),
+            )
+        )
+    with db_conn() as conn, conn.cursor() as cur:
+        cur.executemany(
+            """
+            INSERT INTO events (
+                person_id, event_type, date_literal,
+                year, month, day, place, country, source_id, notes
+            ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+            RETURNING event_id
+            """,
+            tuples,
+            returning=True,
+        )
+        ids = _returned_ids(cur, "event_id")
+    for pid in {row["person_id"] for row in rows}:
+        _cache_invalidate("events", pid)
+    return ids
+
+
 @mcp.tool()
 def add_event(
     person_id: str,
     event_type: str,
-    date_literal: str = "",
-    year: int = 0,
-    month: int = 0,
-    day: int = 0,
-    place: str = "",
-    country: str = "",
-    source_id: str = "",
-    notes: str = "",
+    date_literal: Optional[str] = None,
+    year: Optional[int] = None,
+    month: Optional[int] = None,
+    day: Optional[int] = None,
+    place: Optional[str] = None,
+    country: Optional[str] = None,
+    source_id: Optional[str] = None,
+    notes: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Add a life event for a person (birth, marriage, death, census, residence, etc.).
@@ -223,30 +512,41 @@ def add_event(
     if not event_type:
         return err("missing_event_type")
 
-    eid = str(uuid.uuid4())
-    with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
-            """
-            INSERT INTO events (
-                event_id, person_id, event_type, date_literal,
-                year, month, day, place, country, source_id, notes
-            ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-            """,
-            (
-                eid,
-                person_id,
-                event_type,
-                date_literal or None,
-                year or None,
-                month or None,
-                day or None,
-                place or None,
-                country or None,
-                source_id or None,
-                notes or None,
-            ),
-        )
-    return ok({"event_id": eid})
+    ids = _insert_events(
+        [
+            {
+                "person_id": person_id,
+                "event_type": event_type,
+                "date_literal": date_literal,
+                "year": year,
+                "month": month,
+                "day": day,
+                "place": place,
+                "country": country,
+                "source_id": source_id,
+                "notes": notes,
+            }
+        ]
+    )
+    return ok({"event_id": ids[0]})
+
+
+@mcp.tool()
+def add_events_bulk(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Insert many events in a single round-trip.
+    Each row takes the same fields as add_event.
+    """
+    if not rows:
+        return err("missing_rows")
+    for i, row in enumerate(rows):
+        if not row.get("person_id"):
+            return err("missing_person_id", {"row": i})
+        if not row.get("event_type"):
+            return err("missing_event_type", {"row": i})
+
+    ids = _insert_events(rows)
+    return ok({"count": len(ids), "event_ids": ids})
 
 
 @mcp.tool()
@@ -256,10 +556,13 @@ def list_person_events(person_id: str) -> Dict[str, Any]:
     """
     if not person_id:
         return err("missing_person_id")
+    cached = _cache_get("events", person_id)
+    if cached is not None:
+        return ok(cached)
     with db_conn() as conn, conn.cursor() as cur:
         cur.execute(
-            """
-            SELECT *
+            f"""
+            SELECT {EVENT_COLUMNS}
             FROM events
             WHERE person_id = %s
             ORDER BY year NULLS LAST, month NULLS LAST, day NULLS LAST
@@ -267,22 +570,57 @@ def list_person_events(person_id: str) -> Dict[str, Any]:
             (person_id,),
         )
         rows = cur.fetchall()
-    return ok({"count": len(rows), "events": rows})
+    data = {"count": len(rows), "events": rows}
+    _cache_put("events", person_id, data)
+    return ok(data)
 
 
 # ----------------------------------------------------------
 # PROFESSION TOOLS
 # ----------------------------------------------------------
 
+def _insert_professions(rows: List[Dict[str, Any]]) -> List[str]:
+    """Insert profession rows in one round-trip; returns the new profession_ids."""
+    tuples = []
+    for row in rows:
+        tuples.append(
+            (
+                row["person_id"],
+                row["title"],
+                row.get("start_year"),
+                row.get("end_year"),
+                row.get("location"),
+                row.get("source_id"),
+                row.get("notes"),
+            )
+        )
+    with db_conn() as conn, conn.cursor() as cur:
+        cur.executemany(
+            """
+            INSERT INTO professions (
+                person_id, title, start_year,
+                end_year, location, source_id, notes
+            ) VALUES (%s,%s,%s,%s,%s,%s,%s)
+            RETURNING profession_id
+            """,
+            tuples,
+            returning=True,
+        )
+        ids = _returned_ids(cur, "profession_id")
+    for pid in {row["person_id"] for row in rows}:
+        _cache_invalidate("professions", pid)
+    return ids
+
+
 @mcp.tool()
 def add_profession(
     person_id: str,
     title: str,
-    start_year: int = 0,
-    end_year: int = 0,
-    location: str = "",
-    source_id: str = "",
-    notes: str = "",
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    location: Optional[str] = None,
+    source_id: Optional[str] = None,
+    notes: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Add a profession/job for a person.
@@ -292,27 +630,38 @@ def add_profession(
     if not title:
         return err("missing_title")
 
-    prof_id = str(uuid.uuid4())
-    with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
-            """
-            INSERT INTO professions (
-                profession_id, person_id, title, start_year,
-                end_year, location, source_id, notes
-            ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s)
-            """,
-            (
-                prof_id,
-                person_id,
-                title,
-                start_year or None,
-                end_year or None,
-                location or None,
-                source_id or None,
-                notes or None,
-            ),
-        )
-    return ok({"profession_id": prof_id})
+    ids = _insert_professions(
+        [
+            {
+                "person_id": person_id,
+                "title": title,
+                "start_year": start_year,
+                "end_year": end_year,
+                "location": location,
+                "source_id": source_id,
+                "notes": notes,
+            }
+        ]
+    )
+    return ok({"profession_id": ids[0]})
+
+
+@mcp.tool()
+def add_professions_bulk(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Insert many professions in a single round-trip.
+    Each row takes the same fields as add_profession.
+    """
+    if not rows:
+        return err("missing_rows")
+    for i, row in enumerate(rows):
+        if not row.get("person_id"):
+            return err("missing_person_id", {"row": i})
+        if not row.get("title"):
+            return err("missing_title", {"row": i})
+
+    ids = _insert_professions(rows)
+    return ok({"count": len(ids), "profession_ids": ids})
 
 
 @mcp.tool()
@@ -322,10 +671,13 @@ def list_person_professions(person_id: str) -> Dict[str, Any]:
     """
     if not person_id:
         return err("missing_person_id")
+    cached = _cache_get("professions", person_id)
+    if cached is not None:
+        return ok(cached)
     with db_conn() as conn, conn.cursor() as cur:
         cur.execute(
-            """
-            SELECT *
+            f"""
+            SELECT {PROFESSION_COLUMNS}
             FROM professions
             WHERE person_id = %s
             ORDER BY start_year NULLS LAST
@@ -333,25 +685,64 @@ def list_person_professions(person_id: str) -> Dict[str, Any]:
             (person_id,),
         )
         rows = cur.fetchall()
-    return ok({"count": len(rows), "professions": rows})
+    data = {"count": len(rows), "professions": rows}
+    _cache_put("professions", person_id, data)
+    return ok(data)
 
 
 # ----------------------------------------------------------
 # ADDRESS TOOLS
 # ----------------------------------------------------------
 
+def _insert_addresses(rows: List[Dict[str, Any]]) -> List[str]:
+    """Insert address rows in one round-trip; returns the new address_ids."""
+    tuples = []
+    for row in rows:
+        tuples.append(
+            (
+                row["person_id"],
+                row.get("street"),
+                row.get("house_number"),
+                row.get("city"),
+                row.get("province"),
+                row.get("country"),
+                row.get("start_year"),
+                row.get("end_year"),
+                row.get("source_id"),
+                row.get("notes"),
+            )
+        )
+    with db_conn() as conn, conn.cursor() as cur:
+        cur.executemany(
+            """
+            INSERT INTO addresses (
+                person_id, street, house_number,
+                city, province, country, start_year, end_year,
+                source_id, notes
+            ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+            RETURNING address_id
+            """,
+            tuples,
+            returning=True,
+        )
+        ids = _returned_ids(cur, "address_id")
+    for pid in {row["person_id"] for row in rows}:
+        _cache_invalidate("addresses", pid)
+    return ids
+
+
 @mcp.tool()
 def add_address(
     person_id: str,
-    street: str = "",
-    house_number: str = "",
-    city: str = "",
-    province: str = "",
-    country: str = "",
-    start_year: int = 0,
-    end_year: int = 0,
-    source_id: str = "",
-    notes: str = "",
+    street: Optional[str] = None,
+    house_number: Optional[str] = None,
+    city: Optional[str] = None,
+    province: Optional[str] = None,
+    country: Optional[str] = None,
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    source_id: Optional[str] = None,
+    notes: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Add a residential address for a person (can be multiple over time).
@@ -359,31 +750,39 @@ def add_address(
     if not person_id:
         return err("missing_person_id")
 
-    addr_id = str(uuid.uuid4())
-    with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
-            """
-            INSERT INTO addresses (
-                address_id, person_id, street, house_number,
-                city, province, country, start_year, end_year,
-                source_id, notes
-            ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-            """,
-            (
-                addr_id,
-                person_id,
-                street or None,
-                house_number or None,
-                city or None,
-                province or None,
-                country or None,
-                start_year or None,
-                end_year or None,
-                source_id or None,
-                notes or None,
-            ),
-        )
-    return ok({"address_id": addr_id})
+    ids = _insert_addresses(
+        [
+            {
+                "person_id": person_id,
+                "street": street,
+                "house_number": house_number,
+                "city": city,
+                "province": province,
+                "country": country,
+                "start_year": start_year,
+                "end_year": end_year,
+                "source_id": source_id,
+                "notes": notes,
+            }
+        ]
+    )
+    return ok({"address_id": ids[0]})
+
+
+@mcp.tool()
+def add_addresses_bulk(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Insert many addresses in a single round-trip.
+    Each row takes the same fields as add_address.
+    """
+    if not rows:
+        return err("missing_rows")
+    for i, row in enumerate(rows):
+        if not row.get("person_id"):
+            return err("missing_person_id", {"row": i})
+
+    ids = _insert_addresses(rows)
+    return ok({"count": len(ids), "address_ids": ids})
 
 
 @mcp.tool()
@@ -393,10 +792,13 @@ def list_person_addresses(person_id: str) -> Dict[str, Any]:
     """
     if not person_id:
         return err("missing_person_id")
+    cached = _cache_get("addresses", person_id)
+    if cached is not None:
+        return ok(cached)
     with db_conn() as conn, conn.cursor() as cur:
         cur.execute(
-            """
-            SELECT *
+            f"""
+            SELECT {ADDRESS_COLUMNS}
             FROM addresses
             WHERE person_id = %s
             ORDER BY start_year NULLS LAST
@@ -404,7 +806,9 @@ def list_person_addresses(person_id: str) -> Dict[str, Any]:
             (person_id,),
         )
         rows = cur.fetchall()
-    return ok({"count": len(rows), "addresses": rows})
+    data = {"count": len(rows), "addresses": rows}
+    _cache_put("addresses", person_id, data)
+    return ok(data)
 
 
 # ----------------------------------------------------------
@@ -413,12 +817,12 @@ def list_person_addresses(person_id: str) -> Dict[str, Any]:
 
 @mcp.tool()
 def add_attachment(
-    source_id: str = "",
-    person_id: str = "",
-    file_name: str = "",
-    file_type: str = "",
-    file_path: str = "",
-    description: str = "",
+    source_id: Optional[str] = None,
+    person_id: Optional[str] = None,
+    file_name: Optional[str] = None,
+    file_type: Optional[str] = None,
+    file_path: Optional[str] = None,
+    description: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Register an attachment (image/PDF/etc) by path.
@@ -427,25 +831,25 @@ def add_attachment(
     if not file_name and not file_path:
         return err("missing_file_info")
 
-    att_id = str(uuid.uuid4())
     with db_conn() as conn, conn.cursor() as cur:
         cur.execute(
             """
             INSERT INTO attachments (
-                attachment_id, source_id, person_id,
+                source_id, person_id,
                 file_name, file_type, file_path, description
-            ) VALUES (%s,%s,%s,%s,%s,%s,%s)
+            ) VALUES (%s,%s,%s,%s,%s,%s)
+            RETURNING attachment_id
             """,
             (
-                att_id,
-                source_id or None,
-                person_id or None,
-                file_name or None,
-                file_type or None,
-                file_path or None,
-                description or None,
+                source_id,
+                person_id,
+                file_name,
+                file_type,
+                file_path,
+                description,
             ),
         )
+        att_id = str(cur.fetchone()["attachment_id"])
     return ok({"attachment_id": att_id})
 
 
@@ -455,9 +859,9 @@ def add_attachment(
 
 @mcp.tool()
 def add_comment(
-    person_id: str = "",
-    source_id: str = "",
-    author: str = "",
+    person_id: Optional[str] = None,
+    source_id: Optional[str] = None,
+    author: Optional[str] = None,
     text: str = "",
 ) -> Dict[str, Any]:
     """
@@ -466,22 +870,24 @@ def add_comment(
     if not text:
         return err("missing_text")
 
-    cid = str(uuid.uuid4())
     with db_conn() as conn, conn.cursor() as cur:
         cur.execute(
             """
             INSERT INTO comments (
-                comment_id, person_id, source_id, author, text
-            ) VALUES (%s,%s,%s,%s,%s)
+                person_id, source_id, author, text
+            ) VALUES (%s,%s,%s,%s)
+            RETURNING comment_id
             """,
             (
-                cid,
-                person_id or None,
-                source_id or None,
-                author or None,
+                person_id,
+                source_id,
+                author,
                 text,
             ),
         )
+        cid = str(cur.fetchone()["comment_id"])
+    if person_id:
+        _cache_invalidate("comments", person_id)
     return ok({"comment_id": cid})
 
 
@@ -493,10 +899,13 @@ def list_person_comments(person_id: str) -> Dict[str, Any]:
     if not person_id:
         return err("missing_person_id")
 
+    cached = _cache_get("comments", person_id)
+    if cached is not None:
+        return ok(cached)
     with db_conn() as conn, conn.cursor() as cur:
         cur.execute(
-            """
-            SELECT *
+            f"""
+            SELECT {COMMENT_COLUMNS}
             FROM comments
             WHERE person_id = %s
             ORDER BY created_at
@@ -504,7 +913,9 @@ def list_person_comments(person_id: str) -> Dict[str, Any]:
             (person_id,),
         )
         rows = cur.fetchall()
-    return ok({"count": len(rows), "comments": rows})
+    data = {"count": len(rows), "comments": rows}
+    _cache_put("comments", person_id, data)
+    return ok(data)
 
 
 # ----------------------------------------------------------
@@ -515,14 +926,17 @@ def list_person_comments(person_id: str) -> Dict[str, Any]:
 def log_crawl(
     url: str,
     http_status: int = 200,
-    content_hash: str = "",
-    notes: str = "",
+    content_hash: Optional[str] = None,
+    notes: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Record or update a crawl entry so the agent can avoid re-crawling the same URL.
     """
     if not url:
         return err("missing_url")
+    # The WHERE clause skips the row rewrite (and its WAL) entirely when a
+    # re-crawl saw identical content and last_seen is less than a minute
+    # stale, which is the common case for frequently re-visited URLs.
     sql = (
         "INSERT INTO crawl_log (url, http_status, content_hash, notes) "
         "VALUES (%s, %s, %s, %s) "
@@ -530,25 +944,38 @@ def log_crawl(
         "last_seen = NOW(), "
         "http_status = EXCLUDED.http_status, "
         "content_hash = EXCLUDED.content_hash, "
-        "notes = EXCLUDED.notes;"
+        "notes = EXCLUDED.notes "
+        "WHERE crawl_log.content_hash IS DISTINCT FROM EXCLUDED.content_hash "
+        "   OR crawl_log.http_status IS DISTINCT FROM EXCLUDED.http_status "
+        "   OR crawl_log.notes IS DISTINCT FROM EXCLUDED.notes "
+        "   OR crawl_log.last_seen < NOW() - interval '1 minute';"
     )
     with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(sql, (url, http_status, content_hash or None, notes or None))
+        cur.execute(
+            sql,
+            (url, http_status, content_hash, notes),
+        )
     return ok({"url": url})
 
 
 @mcp.tool()
 def get_unprocessed_crawls(limit: int = 20) -> Dict[str, Any]:
     """
-    Return crawl_log rows that are not yet processed/analysed.
+    Atomically claim up to `limit` unprocessed crawl_log rows, marking
+    them processed as they are returned. FOR UPDATE SKIP LOCKED makes
+    this safe for concurrent agents: no two callers get the same URL.
     """
     limit = max(1, min(limit, 200))
     sql = (
-        "SELECT * "
-        "FROM crawl_log "
-        "WHERE processed = FALSE "
-        "ORDER BY first_seen ASC "
-        "LIMIT %s;"
+        "UPDATE crawl_log SET processed = TRUE "
+        "WHERE crawl_id IN ("
+        "    SELECT crawl_id FROM crawl_log "
+        "    WHERE processed = FALSE "
+        "    ORDER BY first_seen ASC "
+        "    FOR UPDATE SKIP LOCKED "
+        "    LIMIT %s"
+        ") "
+        f"RETURNING {CRAWL_COLUMNS};"
     )
     with db_conn() as conn, conn.cursor() as cur:
         cur.execute(sql, (limit,))
@@ -588,7 +1015,7 @@ def set_person_verified(person_id: str, verified: bool = True) -> Dict[str, Any]
 def set_person_status(
     person_id: str,
     status: str,
-    notes: str = "",
+    notes: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Update research_status and optional research_notes for a person.
@@ -600,17 +1027,17 @@ def set_person_status(
     with db_conn() as conn, conn.cursor() as cur:
         cur.execute(
             "UPDATE persons SET research_status = %s, research_notes = %s WHERE person_id = %s",
-            (status, notes or None, person_id),
+            (status, notes, person_id),
         )
     return ok({"person_id": person_id, "status": status})
 
 
 @mcp.tool()
 def add_attachment_metadata(
-    person_id: str = "",
-    source_id: str = "",
+    person_id: Optional[str] = None,
+    source_id: Optional[str] = None,
     download_url: str = "",
-    description: str = "",
+    description: Optional[str] = None,
     should_fetch: bool = False,
 ) -> Dict[str, Any]:
     """
@@ -618,25 +1045,25 @@ def add_attachment_metadata(
     """
     if not download_url:
         return err("missing_download_url")
-    att_id = str(uuid.uuid4())
     with db_conn() as conn, conn.cursor() as cur:
         cur.execute(
             """
             INSERT INTO attachments (
-                attachment_id, person_id, source_id,
+                person_id, source_id,
                 download_url, description, should_fetch
             )
-            VALUES (%s,%s,%s,%s,%s,%s)
+            VALUES (%s,%s,%s,%s,%s)
+            RETURNING attachment_id
             """,
             (
-                att_id,
-                person_id or None,
-                source_id or None,
+                person_id,
+                source_id,
                 download_url,
-                description or None,
+                description,
                 should_fetch,
             ),
         )
+        att_id = str(cur.fetchone()["attachment_id"])
     return ok({"attachment_id": att_id})
 
 
@@ -650,9 +1077,7 @@ def fetch_attachments_for_person(person_id: str) -> Dict[str, Any]:
     """
     if not person_id:
         return err("missing_person_id")
-    base_path = Path("/attachments")
-    base_path.mkdir(exist_ok=True)
-    results: List[Dict[str, Any]] = []
+
     with db_conn() as conn, conn.cursor() as cur:
         cur.execute(
             """
@@ -666,45 +1091,62 @@ def fetch_attachments_for_person(person_id: str) -> Dict[str, Any]:
             (person_id,),
         )
         rows = cur.fetchall()
-        for row in rows:
-            att_id = row["attachment_id"]
-            url = row["download_url"]
+
+    def _download(att_id: str, url: str) -> Dict[str, Any]:
+        # Stream to disk in 1 MiB chunks so peak memory stays constant
+        # regardless of file size, hashing each chunk in the same pass.
+        with HTTP.get(url, stream=True, timeout=20) as resp:
+            if resp.status_code != 200:
+                return {
+                    "attachment_id": att_id,
+                    "error": f"http_status={resp.status_code}",
+                }
+            filepath = os.path.join(ATTACHMENTS_DIR_STR, f"{att_id}.bin")
+            digest = hashlib.sha256()
+            with open(filepath, "wb") as f:
+                for chunk in resp.iter_content(chunk_size=1024 * 1024):
+                    digest.update(chunk)
+                    f.write(chunk)
+        return {
+            "attachment_id": att_id,
+            "saved_path": filepath,
+            "sha256": digest.hexdigest(),
+        }
+
+    # Downloads are IO-bound: overlap them on a thread pool over the
+    # shared keep-alive session.
+    results: List[Dict[str, Any]] = []
+    fetched: List[tuple] = []
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        futures = {
+            pool.submit(_download, row["attachment_id"], row["download_url"]):
+                row["attachment_id"]
+            for row in rows
+        }
+        for future, att_id in futures.items():
             try:
-                resp = requests.get(url, timeout=20)
-                if resp.status_code != 200:
-                    results.append(
-                        {
-                            "attachment_id": att_id,
-                            "error": f"http_status={resp.status_code}",
-                        }
-                    )
-                    continue
-                filename = f"{att_id}.bin"
-                filepath = base_path / filename
-                filepath.write_bytes(resp.content)
-                cur.execute(
-                    """
-                    UPDATE attachments
-                    SET file_path = %s,
-                        file_type = 'binary',
-                        fetched = TRUE
-                    WHERE attachment_id = %s
-                    """,
-                    (str(filepath), att_id),
-                )
-                results.append(
-                    {
-                        "attachment_id": att_id,
-                        "saved_path": str(filepath),
-                    }
-                )
+                result = future.result()
             except Exception as e:
-                results.append(
-                    {
-                        "attachment_id": att_id,
-                        "error": str(e),
-                    }
-                )
+                result = {"attachment_id": att_id, "error": str(e)}
+            if "saved_path" in result:
+                fetched.append((att_id, result["saved_path"], result["sha256"]))
+            results.append(result)
+
+    # Mark all successful downloads in one pipelined batch instead of a
+    # round-trip per attachment.
+    if fetched:
+        with db_conn() as conn, conn.cursor() as cur:
+            cur.executemany(
+                """
+                UPDATE attachments
+                SET file_path = %s,
+                    file_type = 'binary',
+                    fetched = TRUE,
+                    content_hash = %s
+                WHERE attachment_id = %s
+                """,
+                [(path, sha, att_id) for att_id, path, sha in fetched],
+            )
     return ok({"person_id": person_id, "results": results})
 
 
@@ -718,7 +1160,7 @@ def add_relationship(
     person_id_b: str,
     relation_type: str,
     confidence_score: float = 1.0,
-    notes: str = "",
+    notes: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Create a relationship record between two persons.
@@ -729,21 +1171,21 @@ def add_relationship(
     if not relation_type:
         return err("missing_relation_type")
 
-    rid = str(uuid.uuid4())
     with db_conn() as conn, conn.cursor() as cur:
         cur.execute(
             """
             INSERT INTO relationships (
-                relationship_id,
                 person_id_a,
                 person_id_b,
                 relation_type,
                 confidence_score,
                 notes
-            ) VALUES (%s,%s,%s,%s,%s,%s)
+            ) VALUES (%s,%s,%s,%s,%s)
+            RETURNING relationship_id
             """,
-            (rid, person_id_a, person_id_b, relation_type, confidence_score, notes or None),
+            (person_id_a, person_id_b, relation_type, confidence_score, notes),
         )
+        rid = str(cur.fetchone()["relationship_id"])
 
     return ok({"relationship_id": rid})
 
@@ -757,11 +1199,14 @@ def get_person_relationships(person_id: str) -> Dict[str, Any]:
         return err("missing_person_id")
 
     with db_conn() as conn, conn.cursor() as cur:
+        # UNION ALL lets each arm hit its own single-column index
+        # (idx_relationships_person_a/_b) instead of the OR forcing a
+        # sequential scan. No dedup needed: a row cannot match both arms.
         cur.execute(
-            """
-            SELECT *
-            FROM relationships
-            WHERE person_id_a = %s OR person_id_b = %s
+            f"""
+            SELECT {RELATIONSHIP_COLUMNS} FROM relationships WHERE person_id_a = %s
+            UNION ALL
+            SELECT {RELATIONSHIP_COLUMNS} FROM relationships WHERE person_id_b = %s
             """,
             (person_id, person_id),
         )
@@ -774,7 +1219,7 @@ def get_person_relationships(person_id: str) -> Dict[str, Any]:
 def set_possible_duplicate_of(
     person_id: str,
     duplicate_of: str,
-    notes: str = "",
+    notes: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Mark a person as a likely duplicate of another.
@@ -783,20 +1228,25 @@ def set_possible_duplicate_of(
     if not person_id or not duplicate_of:
         return err("missing_person_id")
 
-    extra_note = ""
-    if notes:
-        extra_note = f"\n[Possible duplicate noted] {notes}"
-
     with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
-            """
-            UPDATE persons
-            SET possible_duplicate_of = %s,
-                research_notes = COALESCE(research_notes, '') || %s
-            WHERE person_id = %s
-            """,
-            (duplicate_of, extra_note, person_id),
-        )
+        if notes:
+            extra_note = f"\n[Possible duplicate noted] {notes}"
+            cur.execute(
+                """
+                UPDATE persons
+                SET possible_duplicate_of = %s,
+                    research_notes = COALESCE(research_notes, '') || %s
+                WHERE person_id = %s
+                """,
+                (duplicate_of, extra_note, person_id),
+            )
+        else:
+            # Without notes, leave research_notes alone so Postgres does
+            # not have to re-read and rewrite its TOASTed value.
+            cur.execute(
+                "UPDATE persons SET possible_duplicate_of = %s WHERE person_id = %s",
+                (duplicate_of, person_id),
+            )
 
     return ok({"person_id": person_id, "duplicate_of": duplicate_of})
 